@@ -1,9 +1,31 @@
 """State-space schematic generator public API."""
 
-from .model import StateSpaceModel
-from .parse import load_model, parse_model_dict
-from .graph import GraphStyle, build_graph, build_integrator_graph, build_sfg_graph
-from .render import OutputFormat, graph_to_dot, write_output
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .formats import GraphStyle, OutputFormat
+    from .graph import build_graph, build_integrator_graph, build_sfg_graph
+    from .model import StateSpaceModel
+    from .parse import load_model, parse_model_dict
+    from .render import graph_to_dot, write_output
+
+# Public names are imported on first access (PEP 562) so that importing the package,
+# e.g. for the CLI's --help, does not pull in SymPy and NetworkX.
+_EXPORTS = {
+    "StateSpaceModel": ".model",
+    "GraphStyle": ".formats",
+    "OutputFormat": ".formats",
+    "build_graph": ".graph",
+    "build_integrator_graph": ".graph",
+    "build_sfg_graph": ".graph",
+    "graph_to_dot": ".render",
+    "load_model": ".parse",
+    "parse_model_dict": ".parse",
+    "write_output": ".render",
+}
 
 __all__ = [
     "StateSpaceModel",
@@ -17,3 +39,17 @@ __all__ = [
     "parse_model_dict",
     "write_output",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
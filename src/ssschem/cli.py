@@ -5,10 +5,7 @@ from typing import Optional
 
 import typer
 
-from .formats import OutputFormat
-from .graph import GraphStyle, build_graph
-from .parse import load_model
-from .render import write_output
+from .formats import GraphStyle, OutputFormat
 
 app = typer.Typer(
     help="State-space schematic generator.",
@@ -44,7 +41,9 @@ def build(  # noqa: D401 - handled by Typer
         "--rankdir",
         help="Graphviz rank direction (LR or TB).",
     ),
-    simplify: bool = typer.Option(False, "--simplify", help="Simplify symbolic gains."),
+    simplify: bool = typer.Option(
+        False, "--simplify", help="Simplify symbolic gains, including when pruning zeros."
+    ),
     prune_zeros: bool = typer.Option(False, "--prune-zeros", help="Drop zero-value edges."),
     float_digits: Optional[int] = typer.Option(
         None,
@@ -57,11 +56,20 @@ def build(  # noqa: D401 - handled by Typer
     ),
 ) -> None:
     """Build a schematic from a state-space definition."""
+    # Deferred so that `--help` and argument errors never pay for importing SymPy.
+    from .graph import build_graph
+    from .parse import load_model
+    from .render import write_output
+
     try:
         rank = _normalize_rankdir(rankdir)
         model = load_model(model_path)
         graph = build_graph(
-            model, style=style, unicode_labels=unicode_labels, prune_zeros=prune_zeros
+            model,
+            style=style,
+            unicode_labels=unicode_labels,
+            prune_zeros=prune_zeros,
+            simplify=simplify,
         )
         output_path = out or Path(f"{model.name}.{fmt.value}")
         write_output(
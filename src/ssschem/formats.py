@@ -1,18 +1,38 @@
 from __future__ import annotations
 
 import json
+import re
 from enum import Enum
 from pathlib import Path
 from typing import Any, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover - optional speed-up
+    _orjson_loads = None  # type: ignore[assignment]
+
+# orjson turns integers wider than 64 bits into floats, so inputs with digit runs that
+# long are left to the stdlib parser, which keeps them exact.
+_LONG_DIGITS = re.compile(rb"\d{19,}")
+
 
 class InputFormat(str, Enum):
     YAML = "yaml"
     JSON = "json"
 
 
+class GraphStyle(str, Enum):
+    SFG = "sfg"
+    INTEGRATOR = "integrator"
+
+
 class OutputFormat(str, Enum):
     DOT = "dot"
     SVG = "svg"
@@ -31,12 +51,21 @@ def detect_input_format(path: Path) -> InputFormat:
 
 def load_input_data(path: Path) -> Tuple[InputFormat, Any]:
     fmt = detect_input_format(path)
-    text = path.read_text(encoding="utf-8")
     if fmt is InputFormat.YAML:
-        data = yaml.safe_load(text)
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     else:
-        data = json.loads(text)
+        data = _json_loads(path.read_bytes())
     if data is None:
         msg = f"Input file '{path}' is empty"
         raise ValueError(msg)
     return fmt, data
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _orjson_loads is None or _LONG_DIGITS.search(raw):
+        return json.loads(raw)
+    try:
+        return _orjson_loads(raw)
+    except ValueError:
+        # orjson.JSONDecodeError; the stdlib parser reports the error in its usual form.
+        return json.loads(raw)
@@ -1,21 +1,15 @@
 from __future__ import annotations
 
-from enum import Enum
-from typing import Callable
-
 import networkx as nx
 import sympy as sp
 
+from .formats import GraphStyle
 from .model import StateSpaceModel
 
 S_SYMBOL = sp.Symbol("s")
 ONE = sp.Integer(1)
 ZERO = sp.Integer(0)
-
-
-class GraphStyle(str, Enum):
-    SFG = "sfg"
-    INTEGRATOR = "integrator"
+INV_S = ONE / S_SYMBOL
 
 
 def build_graph(
@@ -24,96 +18,128 @@ def build_graph(
     style: GraphStyle = GraphStyle.SFG,
     unicode_labels: bool = False,
     prune_zeros: bool = False,
+    simplify: bool = False,
 ) -> nx.DiGraph:
     if style is GraphStyle.SFG:
-        return build_sfg_graph(model, unicode_labels=unicode_labels, prune_zeros=prune_zeros)
+        return build_sfg_graph(
+            model, unicode_labels=unicode_labels, prune_zeros=prune_zeros, simplify=simplify
+        )
     if style is GraphStyle.INTEGRATOR:
-        return build_integrator_graph(model, unicode_labels=unicode_labels, prune_zeros=prune_zeros)
+        return build_integrator_graph(
+            model, unicode_labels=unicode_labels, prune_zeros=prune_zeros, simplify=simplify
+        )
     msg = f"Unsupported graph style '{style}'"
     raise ValueError(msg)
 
 
 def build_sfg_graph(
-    model: StateSpaceModel, *, unicode_labels: bool = False, prune_zeros: bool = False
+    model: StateSpaceModel,
+    *,
+    unicode_labels: bool = False,
+    prune_zeros: bool = False,
+    simplify: bool = False,
 ) -> nx.DiGraph:
+    A_rows = model.A.tolist()
+    b_col = [row[0] for row in model.b.tolist()]
+    c_row = model.c.tolist()[0]
+    state_ids = [_state_id(idx) for idx in range(model.order)]
+    xdot_ids = [_xdot_id(idx) for idx in range(model.order)]
     graph = nx.DiGraph()
     graph.add_node("u", type="input", label="u")
     graph.add_node("y", type="output", label="y")
-    for idx in range(model.order):
-        state_id = _state_id(idx)
-        xdot_id = _xdot_id(idx)
+    for idx, (state_id, xdot_id) in enumerate(zip(state_ids, xdot_ids)):
         graph.add_node(state_id, type="state", label=_state_label(idx, unicode_labels))
         graph.add_node(xdot_id, type="xdot", label=_xdot_label(idx, unicode_labels))
     _add_state_edges(
-        graph,
-        model,
-        prune_zeros=prune_zeros,
-        sum_node_fn=lambda idx: _xdot_id(idx),
+        graph, A_rows, b_col, state_ids, xdot_ids, prune_zeros=prune_zeros, simplify=simplify
     )
-    for idx in range(model.order):
-        xdot_id = _xdot_id(idx)
-        state_id = _state_id(idx)
-        _add_edge(graph, xdot_id, state_id, ONE / S_SYMBOL, prune_zeros=False)
-        _add_edge(graph, state_id, "y", model.c[0, idx], prune_zeros=prune_zeros)
-    if model.d != ZERO:
-        _add_edge(graph, "u", "y", model.d, prune_zeros=prune_zeros)
+    for state_id, xdot_id, c_gain in zip(state_ids, xdot_ids, c_row):
+        _add_edge(graph, xdot_id, state_id, INV_S, prune_zeros=False)
+        _add_edge(graph, state_id, "y", c_gain, prune_zeros=prune_zeros, simplify=simplify)
+    if model.d != 0:
+        _add_edge(graph, "u", "y", model.d, prune_zeros=prune_zeros, simplify=simplify)
     return graph
 
 
 def build_integrator_graph(
-    model: StateSpaceModel, *, unicode_labels: bool = False, prune_zeros: bool = False
+    model: StateSpaceModel,
+    *,
+    unicode_labels: bool = False,
+    prune_zeros: bool = False,
+    simplify: bool = False,
 ) -> nx.DiGraph:
+    A_rows = model.A.tolist()
+    b_col = [row[0] for row in model.b.tolist()]
+    c_row = model.c.tolist()[0]
+    state_ids = [_state_id(idx) for idx in range(model.order)]
+    sum_ids = [_sum_id(idx) for idx in range(model.order)]
+    int_ids = [_integrator_id(idx) for idx in range(model.order)]
     graph = nx.DiGraph()
     graph.add_node("u", type="input", label="u")
     graph.add_node("y", type="output", label="y")
     graph.add_node("ysum", type="sum", label=_output_sum_label(unicode_labels))
     _add_edge(graph, "ysum", "y", ONE, prune_zeros=False)
-    for idx in range(model.order):
-        sum_id = _sum_id(idx)
-        int_id = _integrator_id(idx)
-        state_id = _state_id(idx)
+    for idx, (state_id, sum_id, int_id) in enumerate(zip(state_ids, sum_ids, int_ids)):
         graph.add_node(sum_id, type="sum", label=_sum_label(idx, unicode_labels))
         graph.add_node(int_id, type="int", label="1/s")
         graph.add_node(state_id, type="state", label=_state_label(idx, unicode_labels))
         _add_edge(graph, sum_id, int_id, ONE, prune_zeros=False)
         _add_edge(graph, int_id, state_id, ONE, prune_zeros=False)
     _add_state_edges(
-        graph,
-        model,
-        prune_zeros=prune_zeros,
-        sum_node_fn=lambda idx: _sum_id(idx),
+        graph, A_rows, b_col, state_ids, sum_ids, prune_zeros=prune_zeros, simplify=simplify
     )
-    for idx in range(model.order):
-        state_id = _state_id(idx)
-        _add_edge(graph, state_id, "ysum", model.c[0, idx], prune_zeros=prune_zeros)
-    if model.d != ZERO:
-        _add_edge(graph, "u", "ysum", model.d, prune_zeros=prune_zeros)
+    for state_id, c_gain in zip(state_ids, c_row):
+        _add_edge(graph, state_id, "ysum", c_gain, prune_zeros=prune_zeros, simplify=simplify)
+    if model.d != 0:
+        _add_edge(graph, "u", "ysum", model.d, prune_zeros=prune_zeros, simplify=simplify)
     return graph
 
 
 def _add_state_edges(
     graph: nx.DiGraph,
-    model: StateSpaceModel,
+    A_rows: list[list[sp.Expr | float]],
+    b_col: list[sp.Expr | float],
+    state_ids: list[str],
+    sum_ids: list[str],
     *,
     prune_zeros: bool,
-    sum_node_fn: Callable[[int], str],
+    simplify: bool = False,
 ) -> None:
-    for row in range(model.order):
-        sum_node = sum_node_fn(row)
-        for col in range(model.order):
-            src = _state_id(col)
-            gain = model.A[row, col]
-            _add_edge(graph, src, sum_node, gain, prune_zeros=prune_zeros)
-        _add_edge(graph, "u", sum_node, model.b[row, 0], prune_zeros=prune_zeros)
+    edges: list[tuple[str, str, dict[str, sp.Expr | float]]] = []
+    for a_row, b_gain, sum_node in zip(A_rows, b_col, sum_ids):
+        for src, gain in zip(state_ids, a_row):
+            if not (prune_zeros and _is_zero(gain, simplify=simplify)):
+                edges.append((src, sum_node, {"gain": gain}))
+        if not (prune_zeros and _is_zero(b_gain, simplify=simplify)):
+            edges.append(("u", sum_node, {"gain": b_gain}))
+    graph.add_edges_from(edges)
 
 
-def _add_edge(graph: nx.DiGraph, src: str, dst: str, gain: sp.Expr, *, prune_zeros: bool) -> None:
-    if prune_zeros and _is_zero(gain):
+def _add_edge(
+    graph: nx.DiGraph,
+    src: str,
+    dst: str,
+    gain: sp.Expr | float,
+    *,
+    prune_zeros: bool,
+    simplify: bool = False,
+) -> None:
+    if prune_zeros and _is_zero(gain, simplify=simplify):
         return
     graph.add_edge(src, dst, gain=gain)
 
 
-def _is_zero(expr: sp.Expr) -> bool:
+def _is_zero(expr: sp.Expr | float, *, simplify: bool = False) -> bool:
+    # Structural checks first: SymPy already folds trivial cancellations such as ``a - a``
+    # on construction, and running ``simplify`` on every gain dominates large models.
+    if expr is ZERO or expr == 0:
+        return True
+    if isinstance(expr, (int, float)):
+        return False
+    if expr.is_number and expr.is_zero:
+        return True
+    if not simplify or expr.is_zero is False:
+        return False
     return bool(sp.simplify(expr) == 0)
 
 
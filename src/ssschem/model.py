@@ -1,25 +1,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Tuple, Union
 
+import numpy as np
 import sympy as sp
 
+Matrix = Union[sp.Matrix, np.ndarray]
+
 
 @dataclass(frozen=True)
 class StateSpaceModel:
-    """Container for a linear state-space realisation."""
+    """Container for a linear state-space realisation.
+
+    Purely numeric realisations hold ``float`` ndarrays (and a ``float`` ``d``);
+    anything symbolic is kept as SymPy matrices.
+    """
 
     name: str
-    A: sp.Matrix
-    b: sp.Matrix
-    c: sp.Matrix
-    d: sp.Expr
+    A: Matrix
+    b: Matrix
+    c: Matrix
+    d: Union[sp.Expr, float]
     variables: Tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
-        n = self.A.rows
-        if self.A.cols != n:
+        n = self.A.shape[0]
+        if self.A.shape[1] != n:
             msg = "Matrix A must be square"
             raise ValueError(msg)
         if self.b.shape != (n, 1):
@@ -29,10 +36,34 @@ class StateSpaceModel:
             msg = f"Vector c must have shape (1, {n})"
             raise ValueError(msg)
 
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ compares field tuples, which is ambiguous for ndarrays.
+        if not isinstance(other, StateSpaceModel):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.variables == other.variables
+            and _matrices_equal(self.A, other.A)
+            and _matrices_equal(self.b, other.b)
+            and _matrices_equal(self.c, other.c)
+            and bool(self.d == other.d)
+        )
+
     @property
     def order(self) -> int:
-        return self.A.rows
+        return self.A.shape[0]
+
+    @property
+    def numeric(self) -> bool:
+        return isinstance(self.A, np.ndarray)
 
     def state_name(self, index: int) -> str:
         """Return the display name for the given zero-based state index."""
         return f"x{index + 1}"
+
+
+def _matrices_equal(left: Matrix, right: Matrix) -> bool:
+    if isinstance(left, np.ndarray) or isinstance(right, np.ndarray):
+        both_arrays = isinstance(left, np.ndarray) and isinstance(right, np.ndarray)
+        return both_arrays and np.array_equal(left, right)
+    return bool(left == right)
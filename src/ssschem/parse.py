@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import math
+import os
+import pickle
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
-import jsonschema
+import numpy as np
 import sympy as sp
 
-from .formats import InputFormat, load_input_data
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speed-up
+    fastjsonschema = None
+
+from .formats import InputFormat, detect_input_format, load_input_data
 from .model import StateSpaceModel
 
 _SCALAR_SCHEMA = {"type": ["number", "string", "integer"]}
@@ -36,68 +48,171 @@ MODEL_SCHEMA: Mapping[str, Any] = {
     },
 }
 
-_VALIDATOR = jsonschema.Draft202012Validator(MODEL_SCHEMA)
+# Compiled once at import when the `fast` extra is installed; it stops at the first error.
+_VALIDATE = fastjsonschema.compile(MODEL_SCHEMA) if fastjsonschema is not None else None
+
+# Decoded JSON/YAML arrays are lists; tuples are accepted for Python API callers by both
+# schema validators. Checking concrete types avoids the ABC hooks behind Sequence checks.
+_ARRAY_TYPES = (list, tuple)
+
+# Largest magnitude below which every integer is exactly representable as a float.
+_MAX_EXACT_INT = 2**53
+
+# Bump whenever parsing changes in a way that invalidates previously cached models.
+_CACHE_VERSION = 3
+# Cached models are only written after validation, so a cache hit stands in for a
+# successful validation against this exact schema.
+_SCHEMA_DIGEST = hashlib.blake2b(
+    json.dumps(MODEL_SCHEMA, sort_keys=True).encode(), digest_size=8
+).hexdigest()
 
 
 def load_model(path: Path) -> StateSpaceModel:
+    cache_path = _cache_path(path)
+    if cache_path is not None:
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
     fmt, data = load_input_data(path)
     source = f"{fmt.value}:{path}"
-    return parse_model_dict(data, source=source)
+    model = parse_model_dict(data, source=source)
+    if cache_path is not None:
+        _store_cached(cache_path, model)
+    return model
 
 
 def parse_model_dict(data: Mapping[str, Any], *, source: str = "input") -> StateSpaceModel:
     _validate_schema(data, source)
     name = str(data.get("name") or "state-space-model")
     variables = tuple(str(v) for v in data.get("variables", []))
-    locals_map = {var: sp.symbols(var) for var in variables}
 
     def parse_expr(value: Any) -> sp.Expr:
+        # Plain numbers skip the sympify parser; bool is an int subclass and keeps sympify.
+        if type(value) is int:
+            return sp.Integer(value)
+        if type(value) is float:
+            return sp.Float(value)
         try:
-            return sp.sympify(value, locals=locals_map)
+            if type(value) is str:
+                return _sympify_cached(value, variables)
+            return sp.sympify(value, locals=dict(_symbols_for(variables)))
         except sp.SympifyError as exc:
             msg = f"Failed to parse expression '{value}' in {source}"
             raise ValueError(msg) from exc
 
-    A = _parse_matrix(data["A"], parse_expr, "A")
-    if A.rows != A.cols:
+    # Single pass over A: shape checks and parsing together, into a flat row-major list.
+    raw_A = data["A"]
+    n = len(raw_A)
+    if n == 0:
+        msg = "A must contain at least one row"
+        raise ValueError(msg)
+    A_flat: list[sp.Expr] = []
+    width: int | None = None
+    for r_index, row in enumerate(raw_A):
+        if not isinstance(row, _ARRAY_TYPES):
+            msg = f"A row {r_index} must be a sequence"
+            raise ValueError(msg)
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            msg = f"A rows must all have {width} columns"
+            raise ValueError(msg)
+        A_flat.extend(parse_expr(value) for value in row)
+    if width != n:
         msg = "Matrix A must be square"
         raise ValueError(msg)
-    n = A.rows
 
-    b = _parse_vector(data["b"], parse_expr, n, "b", column=True)
-    c = _parse_vector(data["c"], parse_expr, n, "c", column=False)
+    b_flat = _parse_vector(data["b"], parse_expr, n, "b")
+    c_flat = _parse_vector(data["c"], parse_expr, n, "c")
     d = parse_expr(data.get("d", 0))
 
-    return StateSpaceModel(name=name, A=A, b=b, c=c, d=d, variables=variables)
+    if _is_plain_number(d) and all(map(_is_plain_number, [*A_flat, *b_flat, *c_flat])):
+        return StateSpaceModel(
+            name=name,
+            A=np.array(A_flat, dtype=float).reshape(n, n),
+            b=np.array(b_flat, dtype=float).reshape(n, 1),
+            c=np.array(c_flat, dtype=float).reshape(1, n),
+            d=float(d),
+            variables=variables,
+        )
+    return StateSpaceModel(
+        name=name,
+        A=sp.Matrix(n, n, A_flat),
+        b=sp.Matrix(n, 1, b_flat),
+        c=sp.Matrix(1, n, c_flat),
+        d=d,
+        variables=variables,
+    )
+
+
+@lru_cache(maxsize=64)
+def _symbols_for(variables: tuple[str, ...]) -> tuple[tuple[str, Any], ...]:
+    # Cached as immutable pairs: sympify may write into its locals, so every call gets a
+    # fresh dict built from these and nothing leaks between models.
+    return tuple((var, sp.symbols(var)) for var in variables)
+
+
+@lru_cache(maxsize=4096)
+def _sympify_cached(value: str, variables: tuple[str, ...]) -> sp.Expr:
+    # SymPy expressions are immutable, so repeated entries such as "-a0" can share one result.
+    return sp.sympify(value, locals=dict(_symbols_for(variables)))
+
+
+def _is_plain_number(value: sp.Expr) -> bool:
+    """Return True if ``value`` converts to a finite float without losing anything.
+
+    Rationals, constants such as sqrt(2), integers beyond 2**53 and high-precision or
+    out-of-range floats stay symbolic to keep their exact labels.
+    """
+    if value.is_Integer:
+        return abs(int(value)) <= _MAX_EXACT_INT
+    if value.is_Float:
+        if value._prec > 53:
+            return False
+        as_float = float(value)
+        return math.isfinite(as_float) and sp.Float(as_float) == value
+    return False
 
 
 def _validate_schema(data: Mapping[str, Any], source: str) -> None:
-    errors = sorted(_VALIDATOR.iter_errors(data), key=lambda e: e.json_path)
-    if not errors:
+    if _VALIDATE is not None:
+        try:
+            _VALIDATE(data)
+        except fastjsonschema.JsonSchemaValueException as exc:
+            # Only the first error is available; format it like the jsonschema messages.
+            message = exc.message.removeprefix(exc.name).strip()
+            msg = f"Input model validation failed for {source}: {_json_path(exc.path)}: {message}"
+            raise ValueError(msg) from exc
         return
+    validator = _jsonschema_validator()
+    if validator.is_valid(data):
+        return
+    errors = sorted(validator.iter_errors(data), key=lambda e: e.json_path)
     joined = "; ".join(f"{error.json_path or '$'}: {error.message}" for error in errors)
     msg = f"Input model validation failed for {source}: {joined}"
     raise ValueError(msg)
 
 
-def _parse_matrix(raw: Sequence[Any], parse_expr: Any, location: str) -> sp.Matrix:
-    rows: list[list[sp.Expr]] = []
-    width: int | None = None
-    for r_index, row in enumerate(raw):
-        if not isinstance(row, Sequence) or isinstance(row, (str, bytes)):
-            msg = f"{location} row {r_index} must be a sequence"
-            raise ValueError(msg)
-        parsed_row = [parse_expr(value) for value in row]
-        if width is None:
-            width = len(parsed_row)
-        elif len(parsed_row) != width:
-            msg = f"{location} rows must all have {width} columns"
-            raise ValueError(msg)
-        rows.append(parsed_row)
-    if not rows:
-        msg = f"{location} must contain at least one row"
-        raise ValueError(msg)
-    return sp.Matrix(rows)
+@lru_cache(maxsize=1)
+def _jsonschema_validator() -> Any:
+    import jsonschema
+
+    # Treat tuples as arrays, matching fastjsonschema and the _ARRAY_TYPES checks below.
+    type_checker = jsonschema.Draft202012Validator.TYPE_CHECKER.redefine(
+        "array", lambda _checker, instance: isinstance(instance, _ARRAY_TYPES)
+    )
+    validator_cls = jsonschema.validators.extend(
+        jsonschema.Draft202012Validator, type_checker=type_checker
+    )
+    return validator_cls(MODEL_SCHEMA)
+
+
+def _json_path(parts: Sequence[Any]) -> str:
+    """Convert a fastjsonschema error path (``['data', 'A', '0']``) to ``$.A[0]``."""
+    path = "$"
+    for part in list(parts)[1:]:
+        path += f"[{part}]" if str(part).isdigit() else f".{part}"
+    return path
 
 
 def _parse_vector(
@@ -105,23 +220,18 @@ def _parse_vector(
     parse_expr: Any,
     expected_len: int,
     location: str,
-    *,
-    column: bool,
-) -> sp.Matrix:
+) -> list[sp.Expr]:
     flattened = _flatten_vector(raw, location)
     if len(flattened) != expected_len:
         msg = f"{location} must have length {expected_len}, got {len(flattened)}"
         raise ValueError(msg)
-    parsed = [parse_expr(value) for value in flattened]
-    if column:
-        return sp.Matrix([[value] for value in parsed])
-    return sp.Matrix([parsed])
+    return [parse_expr(value) for value in flattened]
 
 
 def _flatten_vector(raw: Sequence[Any], location: str) -> list[Any]:
     flattened: list[Any] = []
     for index, value in enumerate(raw):
-        if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        if isinstance(value, _ARRAY_TYPES):
             if len(value) != 1:
                 msg = f"{location} entry {index} must be a scalar or single-element list"
                 raise ValueError(msg)
@@ -129,3 +239,47 @@ def _flatten_vector(raw: Sequence[Any], location: str) -> list[Any]:
         else:
             flattened.append(value)
     return flattened
+
+
+def _cache_path(path: Path) -> Path | None:
+    """Return the cache file for ``path`` keyed on its contents, or None if caching is off."""
+    if os.environ.get("SSSCHEM_NO_CACHE"):
+        return None
+    fmt = detect_input_format(path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_cache_key_prefix()}:{fmt.value}:".encode())
+    digest.update(path.read_bytes())
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "ssschem" / f"{digest.hexdigest()}.pkl"
+
+
+@lru_cache(maxsize=1)
+def _cache_key_prefix() -> str:
+    # Pickles are tied to the libraries that produced them, so entries expire on upgrades.
+    try:
+        package_version = metadata.version("ssschem")
+    except metadata.PackageNotFoundError:
+        package_version = "unknown"
+    return ":".join(
+        (str(_CACHE_VERSION), _SCHEMA_DIGEST, package_version, sp.__version__, np.__version__)
+    )
+
+
+def _load_cached(cache_path: Path) -> StateSpaceModel | None:
+    try:
+        with cache_path.open("rb") as handle:
+            model = pickle.load(handle)
+    except Exception:  # noqa: BLE001 - missing, stale or corrupt entries are re-parsed
+        return None
+    return model if isinstance(model, StateSpaceModel) else None
+
+
+def _store_cached(cache_path: Path, model: StateSpaceModel) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as handle:
+            pickle.dump(model, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 import networkx as nx
 import sympy as sp
@@ -11,6 +12,13 @@ import sympy as sp
 from .formats import OutputFormat
 
 ONE = sp.Integer(1)
+ZERO = sp.Integer(0)
+
+# Size of the DOT slices streamed to Graphviz, so the source is never encoded in one piece.
+_PIPE_CHUNK_CHARS = 64 * 1024
+
+# Integral floats below this magnitude drop their ".0"; larger ones keep repr's exponent form.
+_MAX_PLAIN_INT = 1e15
 
 NODE_STYLES = {
     "input": {"shape": "circle", "style": "filled", "fillcolor": "#dbeafe"},
@@ -21,6 +29,15 @@ NODE_STYLES = {
     "int": {"shape": "box"},
 }
 
+# Emitted once as the graph's `node [...]` block; nodes only spell out where they differ.
+NODE_DEFAULTS = {"shape": "circle"}
+_NODE_OVERRIDES = {
+    node_type: {key: value for key, value in style.items() if NODE_DEFAULTS.get(key) != value}
+    for node_type, style in NODE_STYLES.items()
+}
+# Untyped nodes keep Graphviz's own default shape.
+_UNTYPED_OVERRIDES = {"shape": "ellipse"}
+
 
 def graph_to_dot(
     graph: nx.DiGraph,
@@ -29,18 +46,38 @@ def graph_to_dot(
     simplify: bool = False,
     float_precision: Optional[int] = None,
 ) -> str:
-    styled = graph.copy()
-    for node_id, data in styled.nodes(data=True):
-        node_type = data.get("type")
-        for key, value in NODE_STYLES.get(node_type, {}).items():
-            data.setdefault(key, value)
-        data.setdefault("label", node_id)
-    for _, _, data in styled.edges(data=True):
+    strict = "strict " if nx.number_of_selfloops(graph) == 0 else ""
+    lines = [
+        f"{strict}digraph {{",
+        f"rankdir={_quote(rankdir)};",
+        f"node [{_format_attrs(NODE_DEFAULTS)}];",
+    ]
+    for node_id, data in graph.nodes(data=True):
+        attrs = dict(data)
+        attrs.setdefault("label", node_id)
+        overrides = _NODE_OVERRIDES.get(data.get("type"), _UNTYPED_OVERRIDES)
+        for key, value in overrides.items():
+            attrs.setdefault(key, value)
+        lines.append(f"{_quote(node_id)} [{_format_attrs(attrs)}];")
+    for src, dst, data in graph.edges(data=True):
+        attrs = dict(data)
         gain = data.get("gain", ONE)
-        data["label"] = format_gain(gain, simplify=simplify, float_precision=float_precision)
-    dot = nx.drawing.nx_pydot.to_pydot(styled)
-    dot.set_rankdir(rankdir)
-    return dot.to_string()
+        if "gain" in attrs:
+            # Raw gain, formatted like the label so numeric models don't print "1.0".
+            attrs["gain"] = format_gain(gain)
+        attrs["label"] = format_gain(gain, simplify=simplify, float_precision=float_precision)
+        lines.append(f"{_quote(src)} -> {_quote(dst)} [{_format_attrs(attrs)}];")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _format_attrs(attrs: Mapping[str, Any]) -> str:
+    return ", ".join(f"{key}={_quote(value)}" for key, value in attrs.items())
+
+
+def _quote(value: Any) -> str:
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
 
 
 def write_output(
@@ -63,11 +100,29 @@ def write_output(
 
 
 def format_gain(
-    gain: sp.Expr,
+    gain: sp.Expr | float,
     *,
     simplify: bool = False,
     float_precision: Optional[int] = None,
 ) -> str:
+    if gain is ONE:
+        return "1"
+    if gain is ZERO:
+        return "0"
+    return _format_gain_cached(gain, simplify, float_precision)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_gain_cached(
+    gain: sp.Expr | float, simplify: bool, float_precision: Optional[int]
+) -> str:
+    # SymPy expressions hash and compare structurally, so edges sharing a gain share a label.
+    if isinstance(gain, (int, float)):
+        if float_precision is not None:
+            return f"{gain:.{float_precision}g}"
+        if isinstance(gain, float) and not (gain.is_integer() and abs(gain) < _MAX_PLAIN_INT):
+            return repr(gain)
+        return str(int(gain))
     expr = sp.simplify(gain) if simplify else gain
     if float_precision is not None and expr.is_number:
         try:
@@ -75,13 +130,20 @@ def format_gain(
         except (TypeError, ValueError):
             return str(expr)
         return f"{numeric:.{float_precision}g}"
-    label = str(expr)
-    if label == "1" and gain is ONE:
-        return "1"
-    return label
+    return str(expr)
 
 
 def _render_with_graphviz(source: str, output_path: Path, fmt: OutputFormat) -> None:
+    pygraphviz = _load_pygraphviz()
+    if pygraphviz is not None:
+        # Lay out and render with libgraphviz in-process instead of spawning `dot`.
+        try:
+            agraph = pygraphviz.AGraph(string=source)
+            agraph.draw(str(output_path), format=fmt.value, prog="dot")
+        except (OSError, ValueError) as exc:
+            msg = f"Graphviz failed: {exc}"
+            raise RuntimeError(msg) from exc
+        return
     executable = shutil.which("dot")
     if executable is None:
         msg = (
@@ -89,8 +151,24 @@ def _render_with_graphviz(source: str, output_path: Path, fmt: OutputFormat) ->
         )
         raise RuntimeError(msg)
     command = [executable, f"-T{fmt.value}", "-o", str(output_path)]
+    with subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL) as proc:
+        assert proc.stdin is not None
+        try:
+            for start in range(0, len(source), _PIPE_CHUNK_CHARS):
+                chunk = source[start : start + _PIPE_CHUNK_CHARS]
+                proc.stdin.write(chunk.encode("utf-8"))
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # Graphviz exited early; its exit code below reports the failure.
+    if proc.returncode != 0:
+        msg = f"Graphviz failed with exit code {proc.returncode}"
+        raise RuntimeError(msg)
+
+
+@lru_cache(maxsize=1)
+def _load_pygraphviz() -> Any:
     try:
-        subprocess.run(command, input=source.encode("utf-8"), check=True)
-    except subprocess.CalledProcessError as exc:
-        msg = f"Graphviz failed with exit code {exc.returncode}"
-        raise RuntimeError(msg) from exc
+        import pygraphviz
+    except ImportError:
+        return None
+    return pygraphviz
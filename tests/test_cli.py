@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import os
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
+from ssschem import render
 from ssschem.cli import app
+from ssschem.formats import OutputFormat
 
 
 def test_cli_build_writes_dot(tmp_path: Path) -> None:
@@ -35,3 +42,64 @@ c: [1]
     assert result.exit_code == 0, result.output
     assert out_path.exists()
     assert "digraph" in out_path.read_text(encoding="utf-8")
+
+
+def test_cli_build_renders_svg(tmp_path: Path) -> None:
+    try:
+        import pygraphviz  # noqa: F401
+    except ImportError:
+        if shutil.which("dot") is None:
+            pytest.skip("Graphviz is not available")
+    model_path = tmp_path / "cli.yaml"
+    out_path = tmp_path / "cli.svg"
+    model_path.write_text("A: [[0]]\nb: [1]\nc: [1]\n", encoding="utf-8")
+    result = CliRunner().invoke(
+        app, ["build", "--format", "svg", "--out", str(out_path), str(model_path)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "<svg" in out_path.read_text(encoding="utf-8")
+
+
+def test_cli_import_does_not_load_sympy() -> None:
+    code = "import sys, ssschem.cli; sys.exit('sympy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
+
+def test_cli_build_prune_zeros_with_simplify(tmp_path: Path) -> None:
+    model_path = tmp_path / "z.yaml"
+    out_path = tmp_path / "z.dot"
+    model_path.write_text(
+        'A:\n  - ["a*(b+1) - a*b - a", 1]\n  - [1, "sin(t)**2 + cos(t)**2 - 1"]\n'
+        "b: [1, 1]\nc: [1, 1]\nvariables: [a, b, t]\n",
+        encoding="utf-8",
+    )
+    args = ["build", "--prune-zeros", "--out", str(out_path), str(model_path)]
+    runner = CliRunner()
+    assert runner.invoke(app, args).exit_code == 0
+    assert '"x1" -> "xdot1"' in out_path.read_text(encoding="utf-8")
+    assert runner.invoke(app, [*args, "--simplify"]).exit_code == 0
+    dot = out_path.read_text(encoding="utf-8")
+    assert '"x1" -> "xdot1"' not in dot
+    assert '"x2" -> "xdot2"' not in dot
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell stub for dot")
+def test_render_streams_dot_to_graphviz_subprocess(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "dot"
+    stub.write_text('#!/bin/sh\ncat > "$3"\n', encoding="utf-8")
+    stub.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setattr(render, "_load_pygraphviz", lambda: None)
+    # Longer than one pipe chunk and not pure ASCII, so every slice is encoded separately.
+    source = "digraph {\n" + 'x [label="Σ"];\n' * 10_000 + "}\n"
+    out_path = tmp_path / "out.svg"
+    render._render_with_graphviz(source, out_path, OutputFormat.SVG)
+    assert out_path.read_bytes() == source.encode("utf-8")
+
+    stub.write_text("#!/bin/sh\nexit 3\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="Graphviz failed with exit code 3"):
+        render._render_with_graphviz(source, out_path, OutputFormat.SVG)
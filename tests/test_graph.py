@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import networkx as nx
+import numpy as np
+import pytest
 import sympy as sp
 
 from ssschem.graph import build_integrator_graph, build_sfg_graph
 from ssschem.model import StateSpaceModel
+from ssschem.render import graph_to_dot
 
 
 def _demo_model(d_value: int | float = 0) -> StateSpaceModel:
@@ -33,3 +37,92 @@ def test_integrator_graph_includes_output_sum_and_feedthrough() -> None:
     assert "ysum" in graph.nodes
     assert ("u", "ysum") in graph.edges
     assert graph.edges[("u", "ysum")]["gain"] == 2
+
+
+def test_prune_zero_edges_keeps_symbolic_gains() -> None:
+    a = sp.Symbol("a")
+    model = StateSpaceModel(
+        name="sym",
+        A=sp.Matrix([[a - a]]),
+        b=sp.Matrix([[0.0]]),
+        c=sp.Matrix([[a]]),
+        d=sp.Integer(0),
+    )
+    graph = build_sfg_graph(model, prune_zeros=True)
+    assert ("x1", "xdot1") not in graph.edges
+    assert ("u", "xdot1") not in graph.edges
+    assert graph.edges[("x1", "y")]["gain"] == a
+
+
+def test_numeric_model_graph_carries_float_gains() -> None:
+    model = StateSpaceModel(
+        name="numeric",
+        A=np.array([[0.0, 1.0], [-2.0, -3.0]]),
+        b=np.array([[0.0], [1.0]]),
+        c=np.array([[1.0, 0.0]]),
+        d=0.0,
+    )
+    graph = build_integrator_graph(model, prune_zeros=True)
+    assert graph.edges[("x2", "sum2")]["gain"] == -3.0
+    assert ("x1", "sum1") not in graph.edges
+    assert ("u", "ysum") not in graph.edges
+
+
+def test_graph_to_dot_quotes_labels() -> None:
+    graph = nx.DiGraph()
+    graph.add_node("u", type="input", label='say "hi"\\')
+    graph.add_edge("u", "y", gain=sp.Symbol("k"))
+    dot = graph_to_dot(graph)
+    assert dot.startswith('strict digraph {\nrankdir="LR";\nnode [shape="circle"];\n')
+    assert '"u" [type="input", label="say \\"hi\\"\\\\", style="filled"' in dot
+    assert '"y" [label="y", shape="ellipse"];' in dot
+    assert '"u" -> "y" [gain="k", label="k"];' in dot
+
+
+def test_sfg_integrator_edges_share_inverse_s_gain() -> None:
+    graph = build_sfg_graph(_demo_model())
+    assert graph.edges[("xdot1", "x1")]["gain"] is graph.edges[("xdot2", "x2")]["gain"]
+
+
+def test_graph_to_dot_formats_numeric_gain_attribute() -> None:
+    model = StateSpaceModel(
+        name="numeric",
+        A=np.array([[-3.0]]),
+        b=np.array([[1.0]]),
+        c=np.array([[0.5]]),
+        d=0.0,
+    )
+    dot = graph_to_dot(build_sfg_graph(model))
+    assert '"x1" -> "xdot1" [gain="-3", label="-3"];' in dot
+    assert '"u" -> "xdot1" [gain="1", label="1"];' in dot
+    assert '"x1" -> "y" [gain="0.5", label="0.5"];' in dot
+
+
+def test_graph_to_dot_keeps_exponent_for_large_numeric_gains() -> None:
+    model = StateSpaceModel(
+        name="large",
+        A=np.array([[1e20]]),
+        b=np.array([[1e300]]),
+        c=np.array([[123456789012345.0]]),
+        d=0.0,
+    )
+    dot = graph_to_dot(build_sfg_graph(model))
+    assert '"x1" -> "xdot1" [gain="1e+20", label="1e+20"];' in dot
+    assert '"u" -> "xdot1" [gain="1e+300", label="1e+300"];' in dot
+    assert '"x1" -> "y" [gain="123456789012345", label="123456789012345"];' in dot
+
+
+@pytest.mark.parametrize("simplify", [False, True])
+def test_prune_zero_edges_simplifies_symbolic_zeros_on_request(simplify: bool) -> None:
+    a, b, t = sp.symbols("a b t")
+    model = StateSpaceModel(
+        name="hidden-zeros",
+        A=sp.Matrix([[a * (b + 1) - a * b - a, 0], [0, sp.sin(t) ** 2 + sp.cos(t) ** 2 - 1]]),
+        b=sp.Matrix([[1], [1]]),
+        c=sp.Matrix([[1, 1]]),
+        d=sp.Integer(0),
+    )
+    graph = build_sfg_graph(model, prune_zeros=True, simplify=simplify)
+    for edge in [("x1", "xdot1"), ("x2", "xdot2")]:
+        assert (edge in graph.edges) is not simplify
+    assert ("u", "xdot1") in graph.edges
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 import sympy as sp
 
+from ssschem import parse
+from ssschem.formats import load_input_data
 from ssschem.parse import load_model, parse_model_dict
 
 
@@ -48,3 +51,142 @@ c: [1]
     model = load_model(path)
     assert model.order == 1
     assert model.b[0, 0] == 1
+
+
+def test_load_model_json(tmp_path: Path) -> None:
+    path = tmp_path / "model.json"
+    path.write_text('{"name": "tiny", "A": [[0, 1], [-2, -3]], "b": [0, 1], "c": [1, 0]}')
+    model = load_model(path)
+    assert model.name == "tiny"
+    assert model.A[1, 0] == -2
+
+
+def test_load_model_reuses_cache_for_unchanged_file(tmp_path: Path) -> None:
+    path = tmp_path / "model.yaml"
+    path.write_text("A: [[0]]\nb: [1]\nc: [1]\n", encoding="utf-8")
+    first = load_model(path)
+    assert list((tmp_path / "cache" / "ssschem").glob("*.pkl"))
+    assert load_model(path) == first
+    path.write_text("A: [[0]]\nb: [2]\nc: [1]\n", encoding="utf-8")
+    assert load_model(path).b[0, 0] == 2
+
+
+@pytest.fixture(params=["fastjsonschema", "jsonschema"])
+def validator(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "fastjsonschema":
+        if parse._VALIDATE is None:
+            pytest.skip("fastjsonschema is not installed")
+    else:
+        monkeypatch.setattr(parse, "_VALIDATE", None)
+    return request.param
+
+
+def test_parse_schema_error_reports_path(validator: str) -> None:
+    with pytest.raises(ValueError, match=r"\$\.A\[0\]\[0\]"):
+        parse_model_dict({"A": [[None]], "b": [1], "c": [1]})
+
+
+def test_parse_numeric_model_uses_ndarrays() -> None:
+    model = parse_model_dict({"A": [[0, 1], [-2, -3.5]], "b": [0, 1], "c": [1, 0], "d": 0})
+    assert model.numeric
+    assert isinstance(model.A, np.ndarray)
+    assert model.A.shape == (2, 2)
+    assert model.A[1, 1] == -3.5
+    assert model.c.shape == (1, 2)
+    assert model.d == 0.0
+
+
+def test_parse_symbolic_or_rational_model_stays_sympy() -> None:
+    model = parse_model_dict({"A": [["1/2"]], "b": [1], "c": [1]})
+    assert not model.numeric
+    assert model.A[0, 0] == sp.Rational(1, 2)
+
+
+def test_load_model_cache_hit_skips_validation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "model.yaml"
+    path.write_text("A: [[0]]\nb: [1]\nc: [1]\n", encoding="utf-8")
+    load_model(path)
+
+    def fail(*_: object) -> None:
+        raise AssertionError("schema validation should be skipped on a cache hit")
+
+    monkeypatch.setattr(parse, "_validate_schema", fail)
+    assert load_model(path).order == 1
+    monkeypatch.setenv("SSSCHEM_NO_CACHE", "1")
+    with pytest.raises(AssertionError):
+        load_model(path)
+
+
+def test_parse_accepts_single_element_vector_rows() -> None:
+    model = parse_model_dict({"A": [["a"]], "b": [["k"]], "c": [[1]], "variables": ["a", "k"]})
+    assert model.b[0, 0] == sp.Symbol("k")
+    with pytest.raises(ValueError, match="single-element"):
+        parse_model_dict({"A": [["a"]], "b": [[1, 2]], "c": [1]})
+
+
+def test_load_json_keeps_wide_integers_exact(tmp_path: Path) -> None:
+    path = tmp_path / "wide.json"
+    path.write_text('{"A": [[123456789012345678901234, 1.5]], "b": [1], "c": [1]}')
+    _, data = load_input_data(path)
+    assert data["A"][0] == [123456789012345678901234, 1.5]
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [12345678901234567891, 10**400, "1e400", "1e-400", "0.12345678901234567890123"],
+)
+def test_parse_inexact_numbers_stay_sympy(entry: object) -> None:
+    model = parse_model_dict({"A": [[entry]], "b": [1], "c": [1]})
+    assert not model.numeric
+    assert model.A[0, 0] == sp.sympify(entry)
+    assert model.A[0, 0].is_finite
+
+
+def test_parsed_models_compare_equal() -> None:
+    numeric = {"A": [[0, 1], [2, 3]], "b": [0, 1], "c": [1, 0]}
+    assert parse_model_dict(numeric) == parse_model_dict(numeric)
+    assert parse_model_dict(numeric) != parse_model_dict({**numeric, "c": [0, 1]})
+    symbolic = {**numeric, "A": [[0, 1], ["a", 3]], "variables": ["a"]}
+    assert parse_model_dict(symbolic) == parse_model_dict(symbolic)
+    assert parse_model_dict(symbolic) != parse_model_dict(numeric)
+
+
+def test_parse_schema_errors_first_only_with_fastjsonschema(validator: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        parse_model_dict({"A": [[None]], "b": [None], "c": [1]})
+    message = str(excinfo.value)
+    assert "$.A[0][0]" in message
+    if validator == "fastjsonschema":
+        assert "$.b" not in message
+    else:
+        assert "$.b[0]" in message
+
+
+def test_parse_accepts_tuples_with_either_validator(validator: str) -> None:
+    model = parse_model_dict({"A": ((0, 1), (-2, -3)), "b": (0, (1,)), "c": (1, 0)})
+    assert model.order == 2
+    assert model.A[1, 1] == -3
+
+
+def test_load_model_cache_expires_on_library_upgrade(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "model.yaml"
+    path.write_text("A: [[0]]\nb: [1]\nc: [1]\n", encoding="utf-8")
+    before = parse._cache_path(path)
+    monkeypatch.setattr(sp, "__version__", "0.0-upgraded")
+    parse._cache_key_prefix.cache_clear()
+    try:
+        assert parse._cache_path(path) != before
+    finally:
+        monkeypatch.undo()
+        parse._cache_key_prefix.cache_clear()
+
+
+def test_parse_expression_cannot_rebind_variables_for_later_models() -> None:
+    parse_model_dict({"A": [["(k := 3)"]], "b": [1], "c": [1], "variables": ["k"]})
+    model = parse_model_dict({"A": [["k*2"]], "b": [1], "c": [1], "variables": ["k"]})
+    assert not model.numeric
+    assert model.A[0, 0] == 2 * sp.Symbol("k")